@@ -1,20 +1,24 @@
 """Download alerts from OpenFEMA api."""
 
-import lzma
+import argparse
+import asyncio
 from datetime import UTC, date, datetime
 from pathlib import Path
 
 import httpx
+import msgspec.json
+import zstandard
 from dateutil.relativedelta import relativedelta
 from dateutil.rrule import YEARLY, rrule
 
-TIMESTAMP = datetime.now(tz=UTC).strftime("%Y%m%d_%H%M%S")
 OUT_DIR = Path("data")
 
-SIZE = 10_000
-SKIP = 0
+MAX_IN_FLIGHT = 16
+PAGE_SIZE = 100000
 
-LIMIT = None
+# window kept while streaming so the final record can be re-parsed; must be
+# larger than the biggest single jsonl record
+TAIL_BYTES = 4 << 20
 
 FROM_DATE = date(2025, 1, 1)
 TO_DATE = date(2025, 10, 27)
@@ -25,37 +29,109 @@ TO_DATE = date(2025, 10, 27)
 BASE_URL = "https://www.fema.gov/api/open/v1/IpawsArchivedAlerts?"
 
 
-def get_alerts(
-    client: httpx.Client,
-    url: str,
-    params: dict[str, str],
-    out_path: Path,
-) -> None:
-    try:
-        resp = client.get(url, params=params)
-        resp.raise_for_status()
+class AlertCursor(msgspec.Struct, frozen=True):
+    """Keyset cursor fields of an IpawsArchivedAlerts jsonl record."""
+
+    sent: str
+    id: str
+
+
+_CURSOR_DECODER = msgspec.json.Decoder(AlertCursor)
 
-    except httpx.HTTPStatusError as e:
-        print(f"ERROR {e.response.status_code}: {e.response.url}")
-        raise
 
-    outpath_xz = out_path.with_suffix(out_path.suffix + ".xz")
-    with lzma.open(outpath_xz, "wb") as out_file:
-        out_file.write(resp.text.encode("utf-8"))
+class CountMetadata(msgspec.Struct, frozen=True):
+    """Metadata block of a $count=true reply; only count is used."""
 
+    count: int
 
-def get_alert_count(
-    client: httpx.Client,
+
+class CountResponse(msgspec.Struct, frozen=True):
+    """Envelope of a $count=true reply."""
+
+    metadata: CountMetadata
+
+
+_COUNT_DECODER = msgspec.json.Decoder(CountResponse)
+
+
+def last_cursor(tail: bytes) -> AlertCursor | None:
+    """Extract the cursor fields of the last complete record in a tail buffer.
+
+    Args:
+        tail (bytes): final bytes of a jsonl response body
+
+    Returns:
+        AlertCursor | None: sent and id of the last record, if any
+    """
+    lines = tail.rstrip(b"\n").splitlines()
+    if not lines:
+        return None
+    return _CURSOR_DECODER.decode(lines[-1])
+
+
+async def get_alerts(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, str],
+    out_path: Path,
+    semaphore: asyncio.Semaphore,
+) -> tuple[int, AlertCursor | None]:
+    """Fetch one page of alerts and stream it to a zstd compressed file.
+
+    Args:
+        client (httpx.AsyncClient): shared http client
+        url (str): endpoint url
+        params (dict[str, str]): query parameters for the page
+        out_path (Path): destination path (before the .zst suffix)
+        semaphore (asyncio.Semaphore): cap on in-flight requests
+
+    Returns:
+        tuple[int, AlertCursor | None]: rows written and the sent and id of
+            the final row, used as the keyset cursor for the next page.
+    """
+    outpath_zst = out_path.with_suffix(out_path.suffix + ".zst")
+    compressor = zstandard.ZstdCompressor(level=9, threads=-1)
+    row_count = 0
+    tail = bytearray()
+    async with semaphore:
+        try:
+            async with client.stream("GET", url, params=params) as resp:
+                resp.raise_for_status()
+
+                with (
+                    outpath_zst.open("wb") as raw_file,
+                    compressor.stream_writer(raw_file) as out_file,
+                ):
+                    async for chunk in resp.aiter_bytes(chunk_size=1 << 20):
+                        out_file.write(chunk)
+                        row_count += chunk.count(b"\n")
+                        tail.extend(chunk)
+                        if len(tail) > TAIL_BYTES:
+                            del tail[:-TAIL_BYTES]
+
+        except httpx.HTTPStatusError as e:
+            print(f"ERROR {e.response.status_code}: {e.response.url}")
+            raise
+
+    if tail and not tail.endswith(b"\n"):
+        row_count += 1
+
+    print(f"      DONE {out_path.name}")
+    return row_count, last_cursor(bytes(tail))
+
+
+async def get_alert_count(
+    client: httpx.AsyncClient,
     base_url: str,
     date_from: date,
     date_to: date,
 ) -> int:
     try:
-        resp = client.get(
+        resp = await client.get(
             base_url,
             params={
-                "$filter": f"sent%20ge%20%27{date_from.isoformat()}%27"
-                f"%20and%20sent%20le%20%27{date_to.isoformat()}%27",
+                "$filter": f"sent ge '{date_from.isoformat()}'"
+                f" and sent le '{date_to.isoformat()}'",
                 "$count": "true",
                 "$select": "id",
                 "$top": "1",
@@ -68,78 +144,177 @@ def get_alert_count(
         print(e.response.text)
         raise e
 
-    json_data = resp.json()
-    return int(json_data["metadata"]["count"])
-
+    return _COUNT_DECODER.decode(resp.content).metadata.count
 
-def main():
-    print(f"START {datetime.now(UTC)!s}")
 
-    with httpx.Client(timeout=None) as client:
-        for date_from in rrule(
-            freq=YEARLY,
-            dtstart=FROM_DATE,
-            byyearday=1,
-            until=TO_DATE,
-        ):
-            date_to = date_from + relativedelta(
-                month=12,
-                day=31,
-                hour=23,
-                minute=59,
-                second=59,
+async def download_year(
+    client: httpx.AsyncClient,
+    date_from: date,
+    date_to: date,
+    out_dir: Path,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    """Download one year of alerts with keyset pagination on sent.
+
+    Instead of $skip/$top (which makes the server scan and discard skip
+    rows on every page), each page filters on the (sent, id) pair of the
+    last row of the previous page, so page cost stays flat. The id
+    tie-break matters: sent is not unique, and a strict gt on sent alone
+    would skip rows sharing the page-final timestamp.
+
+    Args:
+        client (httpx.AsyncClient): shared http client
+        date_from (date): start of the year batch
+        date_to (date): end of the year batch
+        out_dir (Path): directory for the downloaded page files
+        semaphore (asyncio.Semaphore): cap on in-flight requests
+    """
+    print(f"BATCH {date_from!s} -- {date_to!s}")
+    record_count = await get_alert_count(
+        client,
+        BASE_URL,
+        date_from,
+        date_to,
+    )
+
+    print(f"      RECORD COUNT: {record_count:,}")
+
+    # the year-end bound never changes; only the cursor side does.
+    # httpx url-encodes params itself, so the filter stays readable text
+    year_filter = f" and sent le '{date_to.isoformat()}'"
+
+    cursor: AlertCursor | None = None
+    remaining = record_count
+    i = 1
+    while remaining > 0:
+        to_request = min(PAGE_SIZE, remaining)
+
+        if cursor is None:
+            cursor_filter = f"sent ge '{date_from.isoformat()}'"
+        else:
+            cursor_filter = (
+                f"(sent gt '{cursor.sent}'"
+                f" or (sent eq '{cursor.sent}' and id gt '{cursor.id}'))"
             )
 
-            print(f"BATCH {date_from!s} -- {date_to!s}")
-            record_count = get_alert_count(
-                client,
-                BASE_URL,
-                date_from,
-                date_to,
-            )
+        params = {
+            "$filter": cursor_filter + year_filter,
+            "$orderby": "sent,id",
+            "$metadata": "off",
+            "$format": "jsonl",
+            "$top": str(to_request),
+        }
+
+        out_path = Path(
+            out_dir,
+            f"IpawsArchivedAlerts_{date_from:%Y}_{i:03d}.jsonl",
+        )
 
-            print(f"      RECORD COUNT: {record_count:,}")
+        rows, page_cursor = await get_alerts(
+            client,
+            BASE_URL,
+            params,
+            out_path,
+            semaphore,
+        )
 
-            skip = 0
-            i = 1
-            while record_count > 0:
-                to_request = min(100000, record_count)
+        print(
+            f"      {i:03d} "
+            f"REQUEST {to_request:,} "
+            f"GOT {rows:,} "
+            f"REMAINING {remaining - rows:,} "
+            f"OUT {out_path.name}\n"
+            f"      {params}",
+        )
 
-                params = {
-                    "$filter": f"sent%20ge%20%27{date_from.isoformat()}%27"
-                    f"%20and%20sent%20le%20%27{date_to.isoformat()}%27",
-                    "$metadata": "off",
-                    "$format": "jsonl",
-                    "$skip": str(skip),
-                    "$top": str(to_request),
-                }
+        if rows == 0 or page_cursor is None:
+            break
 
-                out_path = Path(
-                    OUT_DIR,
-                    f"IpawsArchivedAlerts_{date_from:%Y}_{i:03d}.jsonl",
-                )
+        cursor = page_cursor
+        remaining = remaining - rows
+        i = i + 1
 
-                get_alerts(client, BASE_URL, params, out_path)
+    print()
 
-                print(
-                    f"      {i:03d} "
-                    f"REQUEST {to_request:,} "
-                    f"SKIP {skip:,} "
-                    f"REMAINING {record_count - to_request:,} "
-                    f"OUT {out_path.name}\n"
-                    f"      {params}",
-                )
 
-                record_count = record_count - to_request
-                skip = skip + to_request
-                i = i + 1
+async def main(
+    from_date: date,
+    to_date: date,
+    out_dir: Path,
+    concurrency: int,
+) -> None:
+    print(f"START {datetime.now(UTC)!s}")
 
-            print()
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=None,
+        limits=limits,
+        headers={"Accept-Encoding": "br, gzip"},
+    ) as client:
+        years = [
+            download_year(
+                client,
+                date_from,
+                date_from
+                + relativedelta(month=12, day=31, hour=23, minute=59, second=59),
+                out_dir,
+                semaphore,
+            )
+            for date_from in rrule(
+                freq=YEARLY,
+                dtstart=from_date,
+                byyearday=1,
+                until=to_date,
+            )
+        ]
+        await asyncio.gather(*years)
 
     print(f"END {datetime.now(UTC)!s}")
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Download alerts from the OpenFEMA api.",
+    )
+    parser.add_argument(
+        "--from",
+        dest="from_date",
+        type=date.fromisoformat,
+        default=FROM_DATE,
+        help="first day of alerts to fetch (ISO date)",
+    )
+    parser.add_argument(
+        "--to",
+        dest="to_date",
+        type=date.fromisoformat,
+        default=TO_DATE,
+        help="last day of alerts to fetch (ISO date)",
+    )
+    parser.add_argument(
+        "--outdir",
+        type=Path,
+        default=OUT_DIR,
+        help="directory for the downloaded page files",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MAX_IN_FLIGHT,
+        help="maximum number of in-flight requests",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    asyncio.run(main(args.from_date, args.to_date, args.outdir, args.concurrency))
 
 # 4850417
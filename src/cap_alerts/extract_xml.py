@@ -0,0 +1,62 @@
+"""extract_xml.py -- extract raw alert xml from jsonl into yearly archives."""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from pathlib import Path
+
+import zstandard
+
+from cap_alerts.openfema import iter_records
+
+IN_DIR = Path("data/ipaws_alerts/json")
+OUT_DIR = Path("data/ipaws_alerts/xml")
+
+
+def file_year(file_path: Path) -> str:
+    """Year component of an IpawsArchivedAlerts_{year}_{page} file name.
+
+    Args:
+        file_path (Path): jsonl file with alert records
+
+    Returns:
+        str: the year the file belongs to
+    """
+    return file_path.name.split("_")[1]
+
+
+def process_year(year: str, file_paths: list[Path]) -> None:
+    """Concatenate the raw alert xml for one year into a zstd archive.
+
+    Input files are streamed line by line and the xml is written straight
+    into the compressor, so memory stays flat no matter how large the
+    year is.
+
+    Args:
+        year (str): year being processed
+        file_paths (list[Path]): jsonl files belonging to the year
+    """
+    out_path = OUT_DIR / f"IpawsArchivedAlerts_{year}.xml.zst"
+    compressor = zstandard.ZstdCompressor(level=6, threads=-1)
+    with out_path.open("wb") as raw_out, compressor.stream_writer(raw_out) as out:
+        out.write(b"<alerts>\n")
+        for file_path in file_paths:
+            for record in iter_records(file_path):
+                out.write(record.original_message.encode())
+                out.write(b"\n")
+        out.write(b"</alerts>\n")
+
+
+def main() -> None:
+    """Extract the xml for every year found in IN_DIR, one process per year."""
+    files = sorted(IN_DIR.glob("IpawsArchivedAlerts_*.jsonl.zst"))
+    groups = {year: list(group) for year, group in groupby(files, key=file_year)}
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(process_year, year, paths) for year, paths in groups.items()
+        ]
+        for future in futures:
+            future.result()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,17 @@
 """load_alerts.py -- extract alerts from jsonl and load to database."""
 
 import logging
-import lzma
 import multiprocessing
-from concurrent.futures import Future, ProcessPoolExecutor
+import os
+import time
+from datetime import UTC
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
-import msgspec.json
-from lxml import etree
+import msgspec.msgpack
+import zstandard
+from geoalchemy2 import WKBElement
+from psycopg import sql
 from rich.console import Console
 from rich.progress import (
     BarColumn,
@@ -19,19 +22,29 @@ from rich.progress import (
     TextColumn,
     TimeRemainingColumn,
 )
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, text
 
 from cap_alerts import models
+from cap_alerts.openfema import iter_records
 
 if TYPE_CHECKING:
-    from multiprocessing.managers import DictProxy
+    import ctypes
+    from datetime import datetime
+
+    import psycopg
+    from sqlalchemy import Engine
 
 logger = logging.getLogger(__name__)
 
 
 IN_DIR = Path("data/ipaws_alerts/json")
-FILES = list(IN_DIR.glob("IpawsArchivedAlerts_*.jsonl.xz"))
+RESTORE_DDL_PATH = Path("restore_load_helpers.sql")
+BATCH_SIZE = 1000
+PROGRESS_INTERVAL = 500
+N_LOADERS = 4
+QUEUE_DEPTH = 64
+
+DB_URL = "postgresql+psycopg://cap_alerts_app@localhost/cap_alerts"
 
 
 logging.basicConfig(
@@ -51,8 +64,68 @@ progress_columns = [
 ]
 
 
-session: sessionmaker[Session]
-_progress: DictProxy[Any, Any]
+# (progress, total) pairs, one per task, in plain shared memory
+_progress: ctypes.Array[ctypes.c_uint64]
+
+
+class AreaRows(msgspec.Struct):
+    """Flattened rows for one cap:area element."""
+
+    area: tuple[str, int | None, int | None]
+    polygons: list[str]
+    geocodes: list[tuple[str, str]]
+
+
+class InfoRows(msgspec.Struct):
+    """Flattened rows for one cap:info element."""
+
+    info: tuple[
+        str,
+        str,
+        str,
+        str,
+        str,
+        str | None,
+        str | None,
+        str | None,
+        str | None,
+        str | None,
+        str | None,
+        str | None,
+        str | None,
+        str | None,
+        str | None,
+    ]
+    categories: list[str]
+    response_types: list[str]
+    event_codes: list[tuple[str, str]]
+    parameters: list[tuple[str, str]]
+    resources: list[tuple[str, str, int | None, str | None, str | None, str | None]]
+    areas: list[AreaRows]
+
+
+class AlertRows(msgspec.Struct):
+    """Flattened rows for one alert, ready for IPC and COPY."""
+
+    alert: tuple[
+        str,
+        str,
+        str,
+        str,
+        str,
+        str | None,
+        str,
+        str | None,
+        str | None,
+    ]
+    addresses: list[str]
+    codes: list[str]
+    references: list[tuple[str | None, str, str | None]]
+    incidents: list[str]
+    info: list[InfoRows]
+
+
+_BATCH_DECODER = msgspec.msgpack.Decoder(list[AlertRows])
 
 
 def parse_alert(raw_xml: str) -> models.Alert:
@@ -61,129 +134,692 @@ def parse_alert(raw_xml: str) -> models.Alert:
     Args:
         raw_xml (str): raw alert xml as a string
     """
-    root = etree.fromstring(raw_xml.encode())
-    return models.Alert.from_element(root)
+    return models.Alert.from_bytes(raw_xml.encode())
 
 
-def print_result(future: Future) -> None:
-    """If the task resulted in an exception, print it.
+def has_cmas(alert: models.Alert) -> bool:
+    """Detect if alert was distributed by CMAS.
 
     Args:
-        future (Future): task result
+        alert (models.Alert): alert to check
+
+    Returns:
+        bool: False if alert has parameter BLOCKCHANNEL = CMAS, else True.
     """
-    if e := future.exception():
-        console.log(e)
+    for info in alert.alert_info:
+        for param in info.parameters:
+            if param.value_name == "BLOCKCHANNEL" and param.value == "CMAS":
+                return False
+    return True
 
 
-def init_worker(progress: DictProxy[Any, Any]) -> None:
-    """Initalize worker process.
+def count_lines(file_path: Path) -> int:
+    """Count jsonl records with a cheap streaming decompression pass.
 
     Args:
-        progress (dict): handle for progress bar to update
+        file_path (Path): zstd compressed jsonl file
+
+    Returns:
+        int: number of records in the file
     """
-    global session, _progress
-    engine = create_engine(
-        "postgresql+psycopg://cap_alerts_app@localhost/cap_alerts",
-        echo=False,
+    count = 0
+    decompressor = zstandard.ZstdDecompressor()
+    with file_path.open("rb") as raw_file:
+        reader = decompressor.stream_reader(raw_file)
+        while chunk := reader.read(1 << 20):
+            count += chunk.count(b"\n")
+    return count
+
+
+def _utc_iso(value: datetime) -> str:
+    """Render a datetime as naive-UTC ISO text for IPC and COPY.
+
+    The timestamp columns are timezone-naive, so COPYing text with an
+    offset would have the server silently drop it and store the source-
+    local wall time; rotating to UTC first keeps COPY loads consistent
+    with tz-aware binds under a UTC session.
+
+    Args:
+        value (datetime): timestamp to render
+
+    Returns:
+        str: ISO 8601 text, in UTC without an offset
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def _iso(value: datetime | None) -> str | None:
+    """Render an optional datetime as naive-UTC ISO text for IPC and COPY.
+
+    Args:
+        value (datetime | None): timestamp to render
+
+    Returns:
+        str | None: ISO 8601 text, if a value was given
+    """
+    return _utc_iso(value) if value else None
+
+
+def _geom_text(geom: WKBElement | str) -> str:
+    """Render a polygon column value as text PostGIS can COPY.
+
+    WKBElement values go over as hex EWKB, which the geography input
+    parser takes directly; strings (EWKT) pass through unchanged.
+
+    Args:
+        geom (WKBElement | str): geometry as stored on the ORM object
+
+    Returns:
+        str: hex EWKB or EWKT representation
+    """
+    if isinstance(geom, WKBElement):
+        return geom.desc
+    return geom
+
+
+def flatten_alert(alert: models.Alert) -> AlertRows:
+    """Flatten a parsed alert graph into plain row tuples.
+
+    Datetimes are rendered to ISO text and enums to their stored values
+    so a batch round-trips through msgpack between the parser and loader
+    processes and feeds straight into COPY.
+
+    Args:
+        alert (models.Alert): parsed alert
+
+    Returns:
+        AlertRows: rows for the alert and all of its child tables
+    """
+    return AlertRows(
+        alert=(
+            alert.identifier,
+            alert.sender,
+            _utc_iso(alert.sent),
+            alert.status,
+            alert.msgtype,
+            alert.source,
+            alert.scope,
+            alert.restriction,
+            alert.note,
+        ),
+        addresses=[x.address for x in alert.addresses],
+        codes=[x.code for x in alert.codes],
+        references=[(x.sender, x.identifier, _iso(x.sent)) for x in alert.references],
+        incidents=[x.incident for x in alert.incidents],
+        info=[
+            InfoRows(
+                info=(
+                    info.language,
+                    info.event,
+                    info.urgency.value,
+                    info.severity.value,
+                    info.certainty.value,
+                    info.audience,
+                    _iso(info.effective),
+                    _iso(info.onset),
+                    _iso(info.expires),
+                    info.sender_name,
+                    info.headline,
+                    info.description,
+                    info.instruction,
+                    info.web,
+                    info.contact,
+                ),
+                categories=[x.category.value for x in info.categories],
+                # the column stores member names (no values_callable)
+                response_types=[x.responsetype.name for x in info.response_types],
+                event_codes=[(x.value_name, x.value) for x in info.event_codes],
+                parameters=[(x.value_name, x.value) for x in info.parameters],
+                resources=[
+                    (
+                        x.resource_description,
+                        x.mime_type,
+                        x.size,
+                        x.uri,
+                        x.deref_uri,
+                        x.digest,
+                    )
+                    for x in info.resources
+                ],
+                areas=[
+                    AreaRows(
+                        area=(
+                            area.area_description,
+                            area.altitude,
+                            area.ceiling,
+                        ),
+                        polygons=[_geom_text(x.geom) for x in area.polygons],
+                        geocodes=[(x.value_name, x.value) for x in area.geocodes],
+                    )
+                    for area in info.areas
+                ],
+            )
+            for info in alert.alert_info
+        ],
     )
 
-    session = sessionmaker(engine)
-    _progress = progress
 
+def _next_ids(cur: psycopg.Cursor, sequence: str, count: int) -> list[int]:
+    """Preallocate primary keys from a sequence.
+
+    Args:
+        cur (psycopg.Cursor): open database cursor
+        sequence (str): name of the backing sequence
+        count (int): number of keys to allocate
+
+    Returns:
+        list[int]: allocated primary keys
+    """
+    cur.execute(
+        "SELECT nextval(%s) FROM generate_series(1, %s)",
+        (sequence, count),
+    )
+    return [row[0] for row in cur.fetchall()]
 
-def has_cmas(alert: models.Alert) -> bool:
-    """Detect if alert was distributed by CMAS.
+
+def _copy_rows(
+    cur: psycopg.Cursor,
+    table: str,
+    columns: tuple[str, ...],
+    rows: list[tuple[Any, ...]],
+) -> None:
+    """Stream rows into a table with COPY.
 
     Args:
-        alert (models.Alert): alert to check
+        cur (psycopg.Cursor): open database cursor
+        table (str): destination table name
+        columns (tuple[str, ...]): destination column names
+        rows (list[tuple]): row values, one tuple per row
+    """
+    if not rows:
+        return
+    statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(sql.Identifier(column) for column in columns),
+    )
+    with cur.copy(statement) as cp:
+        for row in rows:
+            cp.write_row(row)
+
+
+def copy_batch(conn: psycopg.Connection, batch: list[AlertRows]) -> None:
+    """Bulk load a batch of flattened alerts with PostgreSQL COPY.
+
+    Preallocates primary keys from the backing sequences and streams
+    each table parent-first so foreign keys stay valid. The caller owns
+    the transaction; nothing is committed here.
+
+    Args:
+        conn (psycopg.Connection): driver-level database connection
+        batch (list[AlertRows]): flattened alerts to load
+    """
+    with conn.cursor() as cur:
+        alert_ids = _next_ids(cur, "alerts_id_seq", len(batch))
+        _copy_rows(
+            cur,
+            "alerts",
+            (
+                "id",
+                "identifier",
+                "sender",
+                "sent",
+                "status",
+                "msgtype",
+                "source",
+                "scope",
+                "restriction",
+                "note",
+            ),
+            [
+                (alert_id, *flat.alert)
+                for alert_id, flat in zip(alert_ids, batch, strict=True)
+            ],
+        )
+
+        addresses = []
+        codes = []
+        references = []
+        incidents = []
+        infos = []
+        for alert_id, flat in zip(alert_ids, batch, strict=True):
+            addresses.extend((alert_id, x) for x in flat.addresses)
+            codes.extend((alert_id, x) for x in flat.codes)
+            references.extend((alert_id, *x) for x in flat.references)
+            incidents.extend((alert_id, x) for x in flat.incidents)
+            infos.extend((alert_id, x) for x in flat.info)
+
+        ids = _next_ids(cur, "alert_addresses_id_seq", len(addresses))
+        _copy_rows(
+            cur,
+            "alert_addresses",
+            ("id", "alert_id", "address"),
+            [(row_id, *row) for row_id, row in zip(ids, addresses, strict=True)],
+        )
+
+        ids = _next_ids(cur, "alert_codes_id_seq", len(codes))
+        _copy_rows(
+            cur,
+            "alert_codes",
+            ("id", "alert_id", "code"),
+            [(row_id, *row) for row_id, row in zip(ids, codes, strict=True)],
+        )
+
+        ids = _next_ids(cur, "alert_references_id_seq", len(references))
+        _copy_rows(
+            cur,
+            "alert_references",
+            ("id", "alert_id", "sender", "identifier", "sent"),
+            [(row_id, *row) for row_id, row in zip(ids, references, strict=True)],
+        )
+
+        ids = _next_ids(cur, "alert_incidents_id_seq", len(incidents))
+        _copy_rows(
+            cur,
+            "alert_incidents",
+            ("id", "alert_id", "incident"),
+            [(row_id, *row) for row_id, row in zip(ids, incidents, strict=True)],
+        )
+
+        info_ids = _next_ids(cur, "alert_info_id_seq", len(infos))
+        _copy_rows(
+            cur,
+            "alert_info",
+            (
+                "id",
+                "alert_id",
+                "language",
+                "event",
+                "urgency",
+                "severity",
+                "certainty",
+                "audience",
+                "effective",
+                "onset",
+                "expires",
+                "sender_name",
+                "headline",
+                "description",
+                "instruction",
+                "web",
+                "contact",
+            ),
+            [
+                (info_id, alert_id, *flat.info)
+                for info_id, (alert_id, flat) in zip(info_ids, infos, strict=True)
+            ],
+        )
+
+        categories = []
+        response_types = []
+        event_codes = []
+        parameters = []
+        resources = []
+        areas = []
+        for info_id, (_, info) in zip(info_ids, infos, strict=True):
+            categories.extend((info_id, x) for x in info.categories)
+            response_types.extend((info_id, x) for x in info.response_types)
+            event_codes.extend((info_id, *x) for x in info.event_codes)
+            parameters.extend((info_id, *x) for x in info.parameters)
+            resources.extend((info_id, *x) for x in info.resources)
+            areas.extend((info_id, x) for x in info.areas)
+
+        ids = _next_ids(cur, "alert_info_categories_id_seq", len(categories))
+        _copy_rows(
+            cur,
+            "alert_info_categories",
+            ("id", "alertinfo_id", "category"),
+            [(row_id, *row) for row_id, row in zip(ids, categories, strict=True)],
+        )
+
+        ids = _next_ids(cur, "alert_info_response_types_id_seq", len(response_types))
+        _copy_rows(
+            cur,
+            "alert_info_response_types",
+            ("id", "alertinfo_id", "responsetype"),
+            [(row_id, *row) for row_id, row in zip(ids, response_types, strict=True)],
+        )
+
+        ids = _next_ids(cur, "alert_info_event_codes_id_seq", len(event_codes))
+        _copy_rows(
+            cur,
+            "alert_info_event_codes",
+            ("id", "alertinfo_id", "value_name", "value"),
+            [(row_id, *row) for row_id, row in zip(ids, event_codes, strict=True)],
+        )
+
+        ids = _next_ids(cur, "alert_info_parameters_id_seq", len(parameters))
+        _copy_rows(
+            cur,
+            "alert_info_parameters",
+            ("id", "alertinfo_id", "value_name", "value"),
+            [(row_id, *row) for row_id, row in zip(ids, parameters, strict=True)],
+        )
+
+        ids = _next_ids(cur, "alert_info_resources_id_seq", len(resources))
+        _copy_rows(
+            cur,
+            "alert_info_resources",
+            (
+                "id",
+                "alertinfo_id",
+                "resource_description",
+                "mime_type",
+                "size",
+                "uri",
+                "deref_uri",
+                "digest",
+            ),
+            [(row_id, *row) for row_id, row in zip(ids, resources, strict=True)],
+        )
+
+        area_ids = _next_ids(cur, "areas_id_seq", len(areas))
+        _copy_rows(
+            cur,
+            "areas",
+            ("id", "alertinfo_id", "area_description", "altitude", "ceiling"),
+            [
+                (area_id, info_id, *flat.area)
+                for area_id, (info_id, flat) in zip(area_ids, areas, strict=True)
+            ],
+        )
+
+        polygons = []
+        geocodes = []
+        for area_id, (_, area) in zip(area_ids, areas, strict=True):
+            polygons.extend((area_id, x) for x in area.polygons)
+            geocodes.extend((area_id, *x) for x in area.geocodes)
+
+        ids = _next_ids(cur, "area_polygons_id_seq", len(polygons))
+        _copy_rows(
+            cur,
+            "area_polygons",
+            ("id", "area_id", "geom"),
+            [(row_id, *row) for row_id, row in zip(ids, polygons, strict=True)],
+        )
+
+        ids = _next_ids(cur, "area_geocodes_id_seq", len(geocodes))
+        _copy_rows(
+            cur,
+            "area_geocodes",
+            ("id", "area_id", "value_name", "value"),
+            [(row_id, *row) for row_id, row in zip(ids, geocodes, strict=True)],
+        )
+
+
+_TABLES = [table.name for table in models.Base.metadata.sorted_tables]
+
+
+def drop_load_helpers(engine: Engine) -> list[str]:
+    """Drop FK constraints and non-PK indexes ahead of a bulk load.
+
+    Every insert otherwise also updates every index and fires every FK
+    check; rebuilding them once after the load is far cheaper. The
+    rebuild script is written to RESTORE_DDL_PATH before anything is
+    dropped, so a crash mid-load leaves a recovery path on disk.
+
+    Args:
+        engine (Engine): database engine
 
     Returns:
-        bool: False if alert has parameter BLOCKCHANNEL = CMAS, else True.
+        list[str]: DDL statements that restore what was dropped
     """
-    for info in alert.alert_info:
-        for param in info.parameters:
-            if param.value_name == "BLOCKCHANNEL" and param.value == "CMAS":
-                return False
-    return True
+    restore_ddl: list[str] = []
+    drop_ddl: list[str] = []
+    with engine.begin() as conn:
+        constraints = conn.execute(
+            text(
+                "SELECT conrelid::regclass::text, conname,"
+                " pg_get_constraintdef(oid)"
+                " FROM pg_constraint"
+                " WHERE contype = 'f'"
+                " AND conrelid::regclass::text = ANY(:tables)",
+            ),
+            {"tables": _TABLES},
+        ).all()
+        for table, name, definition in constraints:
+            drop_ddl.append(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"')
+            restore_ddl.append(
+                f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}',
+            )
+
+        indexes = conn.execute(
+            text(
+                "SELECT indexrelid::regclass::text,"
+                " pg_get_indexdef(indexrelid)"
+                " FROM pg_index"
+                " WHERE indrelid::regclass::text = ANY(:tables)"
+                " AND NOT indisprimary",
+            ),
+            {"tables": _TABLES},
+        ).all()
+        for name, definition in indexes:
+            drop_ddl.append(f'DROP INDEX "{name}"')
+            restore_ddl.append(
+                definition.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1),
+            )
 
+        RESTORE_DDL_PATH.write_text(";\n".join(restore_ddl) + ";\n")
+        logger.info("restore DDL written to %s", RESTORE_DDL_PATH)
+        for statement in drop_ddl:
+            conn.execute(text(statement))
 
-def process_file(task_id: int, file_path: Path) -> None:
-    """Process a jsonl file, extract alert xml, and insert into database.
+    return restore_ddl
+
+
+def restore_load_helpers(engine: Engine, restore_ddl: list[str]) -> None:
+    """Recreate the constraints and indexes dropped before the load.
 
     Args:
-        task_id (int): task id for progress bar
+        engine (Engine): database engine
+        restore_ddl (list[str]): statements from drop_load_helpers
+    """
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT",
+    ) as conn:
+        conn.execute(text("SET maintenance_work_mem = '1GB'"))
+        for statement in restore_ddl:
+            conn.execute(text(statement))
+
+
+def process_file(
+    task_id: int,
+    file_path: Path,
+    row_queue: multiprocessing.Queue,
+    encoder: msgspec.msgpack.Encoder,
+) -> None:
+    """Parse a jsonl file and push flattened row batches to the loaders.
+
+    Args:
+        task_id (int): slot in the shared progress counters
         file_path (Path): jsonl file with alert records
+        row_queue (multiprocessing.Queue): queue of encoded row batches
+        encoder (msgspec.msgpack.Encoder): shared msgpack encoder
     """
-    with lzma.open(file_path, "rt") as f_in:
-        lines = f_in.read().splitlines()
-    len_of_task = len(lines)
+    len_of_task = count_lines(file_path)
+    _progress[2 * task_id + 1] = len_of_task
 
-    decoder = msgspec.json.Decoder()
-    for n, line in enumerate(lines):
-        raw_xml: str = decoder.decode(line)["originalMessage"]
-        alert = parse_alert(raw_xml)
+    batch: list[AlertRows] = []
+    for n, record in enumerate(iter_records(file_path)):
+        alert = parse_alert(record.original_message)
 
-        # skip the non-CMAS alerts from NWS
-        if alert.sender == "w-nws.webmaster@noaa.gov" and not has_cmas(alert):
-            _progress[task_id] = {"progress": n + 1, "total": len_of_task}
-            continue
+        # keep all but the non-CMAS alerts from NWS
+        if alert.sender != "w-nws.webmaster@noaa.gov" or has_cmas(alert):
+            batch.append(flatten_alert(alert))
+            if len(batch) >= BATCH_SIZE:
+                row_queue.put(encoder.encode(batch))
+                batch.clear()
 
-        with session() as s, s.begin():
-            s.add(alert)
+        if (n + 1) % PROGRESS_INTERVAL == 0 or n + 1 == len_of_task:
+            _progress[2 * task_id] = n + 1
 
-        _progress[task_id] = {"progress": n + 1, "total": len_of_task}
+    if batch:
+        row_queue.put(encoder.encode(batch))
 
 
-def main() -> None:
-    """Kick off multi-process ETL job."""
-    console.log("START")
+def parse_worker(
+    file_queue: multiprocessing.Queue,
+    row_queue: multiprocessing.Queue,
+    counters: ctypes.Array[ctypes.c_uint64],
+) -> None:
+    """Drain the file queue, parsing each file into row batches.
 
-    with Progress(*progress_columns, console=console) as progress:
-        futures = []
-        with multiprocessing.Manager() as manager:
-            _progress = manager.dict()
+    Args:
+        file_queue (multiprocessing.Queue): (slot, path) tasks, None to stop
+        row_queue (multiprocessing.Queue): queue of encoded row batches
+        counters (ctypes.Array): shared (progress, total) counters
+    """
+    global _progress
+    _progress = counters
 
-            files = FILES
-            overall_progress_task = progress.add_task(
-                "Loading files…",
-                total=len(files),
-            )
+    encoder = msgspec.msgpack.Encoder()
+    while (task := file_queue.get()) is not None:
+        task_id, file_path = task
+        process_file(task_id, file_path, row_queue, encoder)
 
-            with ProcessPoolExecutor(
-                initializer=init_worker,
-                initargs=(_progress,),
-            ) as executor:
-                for file_path in sorted(files):
-                    task_id = progress.add_task(
-                        f"Loading {file_path.name}…",
-                        visible=False,
-                    )
-                    future = executor.submit(process_file, task_id, file_path)
-                    future.add_done_callback(print_result)
-                    futures.append(future)
 
-                while (n_finished := sum([future.done() for future in futures])) < len(
-                    futures,
-                ):
+def load_worker(row_queue: multiprocessing.Queue) -> None:
+    """Drain the row queue, COPYing each batch into the database.
+
+    Args:
+        row_queue (multiprocessing.Queue): encoded row batches, None to stop
+    """
+    engine = create_engine(DB_URL, echo=False)
+    pool_conn = engine.raw_connection()
+    conn = cast("psycopg.Connection", pool_conn.driver_connection)
+
+    # bypass triggers on the load session (the DBA bulk-load pattern)
+    with conn.cursor() as cur:
+        cur.execute("SET session_replication_role = replica")
+    conn.commit()
+
+    while (payload := row_queue.get()) is not None:
+        copy_batch(conn, _BATCH_DECODER.decode(payload))
+        # batches from different files interleave, so commit per batch
+        conn.commit()
+
+    pool_conn.close()
+
+
+def run_pipeline(files: list[Path]) -> None:
+    """Parse and load the given files with the multi-process pipeline.
+
+    Args:
+        files (list[Path]): jsonl files with alert records
+    """
+    # lock-free shared counters; each worker writes only its own slot pair
+    counters = multiprocessing.Array("Q", len(files) * 2, lock=False)
+
+    n_parsers = max(1, (os.cpu_count() or 2) - N_LOADERS)
+    file_queue: multiprocessing.Queue = multiprocessing.Queue()
+    # bounded so parsers block instead of buffering unread batches in RAM
+    row_queue: multiprocessing.Queue = multiprocessing.Queue(maxsize=QUEUE_DEPTH)
+
+    parsers = [
+        multiprocessing.Process(
+            target=parse_worker,
+            args=(file_queue, row_queue, counters),
+        )
+        for _ in range(n_parsers)
+    ]
+    loaders = [
+        multiprocessing.Process(target=load_worker, args=(row_queue,))
+        for _ in range(N_LOADERS)
+    ]
+    for proc in [*parsers, *loaders]:
+        proc.start()
+
+    for slot, file_path in enumerate(files):
+        file_queue.put((slot, file_path))
+    for _ in parsers:
+        file_queue.put(None)
+
+    with Progress(*progress_columns, console=console) as progress:
+        overall_progress_task = progress.add_task(
+            "Loading files…",
+            total=len(files),
+        )
+        bar_ids = [
+            progress.add_task(f"Loading {file_path.name}…", visible=False)
+            for file_path in files
+        ]
+
+        while any(proc.is_alive() for proc in parsers):
+            # a worker that died mid-file leaves the rest blocked on the
+            # bounded queue; stop polling and tear the job down instead
+            # of spinning forever
+            if any(proc.exitcode for proc in [*parsers, *loaders]):
+                break
+            n_finished = 0
+            for slot, bar_id in enumerate(bar_ids):
+                latest = counters[2 * slot]
+                total = counters[2 * slot + 1]
+                if total:
+                    if latest >= total:
+                        n_finished += 1
+                    # update the progress bar for this task:
                     progress.update(
-                        overall_progress_task,
-                        completed=n_finished,
-                        total=len(futures),
+                        bar_id,
+                        completed=latest,
+                        total=total,
+                        visible=latest < total,
                     )
-                    for task_id, update_data in _progress.items():
-                        latest = update_data["progress"]
-                        total = update_data["total"]
-                        # update the progress bar for this task:
-                        progress.update(
-                            task_id,
-                            completed=latest,
-                            total=total,
-                            visible=latest < total,
-                        )
-
-                # raise any errors:
-                for future in futures:
-                    future.result()
+            progress.update(
+                overall_progress_task,
+                completed=n_finished,
+                total=len(files),
+            )
+            time.sleep(0.1)
+
+    if failed := [proc for proc in [*parsers, *loaders] if proc.exitcode]:
+        # blocked peers cannot be joined, so terminate the pipeline
+        for proc in [*parsers, *loaders]:
+            if proc.is_alive():
+                proc.terminate()
+        for proc in [*parsers, *loaders]:
+            proc.join()
+        msg = f"{len(failed)} worker(s) exited with errors"
+        raise RuntimeError(msg)
+
+    for proc in parsers:
+        proc.join()
+    for _ in loaders:
+        row_queue.put(None)
+    for proc in loaders:
+        proc.join()
+
+    if failed := [proc for proc in loaders if proc.exitcode]:
+        msg = f"{len(failed)} worker(s) exited with errors"
+        raise RuntimeError(msg)
+
+
+def main() -> None:
+    """Kick off multi-process ETL job."""
+    console.log("START")
+
+    # discover input files once, in the parent, so workers do not re-glob
+    # the directory when they import this module
+    with os.scandir(IN_DIR) as entries:
+        files = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.startswith("IpawsArchivedAlerts_")
+            and entry.name.endswith(".jsonl.zst")
+        )
+
+    engine = create_engine(DB_URL, echo=False)
+    restore_ddl = drop_load_helpers(engine)
+
+    # rebuild the dropped helpers even when the load dies part way; on a
+    # crash before this point the script at RESTORE_DDL_PATH still has them
+    try:
+        run_pipeline(files)
+    finally:
+        console.log("REBUILDING INDEXES")
+        restore_load_helpers(engine, restore_ddl)
+        RESTORE_DDL_PATH.unlink(missing_ok=True)
 
     console.log("END")
 
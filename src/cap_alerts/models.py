@@ -1,5 +1,7 @@
 """models.py - Data models for cap_alerts."""
 
+import math
+import struct
 from datetime import datetime
 from enum import Enum
 from itertools import chain
@@ -7,26 +9,37 @@ from typing import TYPE_CHECKING, Self
 
 import sqlalchemy
 from geoalchemy2 import Geography, WKBElement
-from geoalchemy2.shape import from_shape
-from shapely import Point, Polygon
-from sqlalchemy import ForeignKey
+from lxml import etree
+from sqlalchemy import ForeignKey, insert
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from cap_alerts import NS_MAP
 from cap_alerts.db import Base
 from cap_alerts.util import (
     MalformedPolygonError,
-    extract_quoted,
-    find_date,
+    RequiredElementNotFoundError,
+    bucket_all,
+    bucket_all_text,
+    bucket_children,
+    bucket_extract_quoted,
+    bucket_find_date,
+    bucket_find_text,
+    bucket_get_int,
+    bucket_get_text,
     find_text,
-    findall,
-    findalltext,
-    get_date,
     get_int,
     get_text,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+    from typing import IO
+
     from lxml.etree import _Element
+    from sqlalchemy.orm import Session
+
+_ALERT_TAG = f"{{{NS_MAP['cap']}}}alert"
 
 
 class AlertScope(Enum):
@@ -119,6 +132,94 @@ class AlertUrgency(Enum):
     UNKNOWN = "Unknown"
 
 
+# value -> member maps used while parsing; a dict lookup skips the O(n)
+# scan and __call__ protocol of Enum value lookup on every element
+_CATEGORY_MAP = {m.value: m for m in AlertCategoryCode}
+_CERTAINTY_MAP = {m.value: m for m in AlertCertainty}
+_RESPONSE_TYPE_MAP = {m.value: m for m in AlertResponseTypeCode}
+_SEVERITY_MAP = {m.value: m for m in AlertSeverity}
+_URGENCY_MAP = {m.value: m for m in AlertUrgency}
+
+# stored-value lists for the enum columns, computed once instead of in a
+# values_callable lambda every time SQLAlchemy inspects the type
+_CATEGORY_VALUES = [m.value for m in AlertCategoryCode]
+_CERTAINTY_VALUES = [m.value for m in AlertCertainty]
+_SEVERITY_VALUES = [m.value for m in AlertSeverity]
+_URGENCY_VALUES = [m.value for m in AlertUrgency]
+
+# the scalar children of cap:info, selected by one compiled XPath union
+# so the walk happens in C instead of one lookup per field
+_INFO_SCALARS = (
+    "language",
+    "event",
+    "urgency",
+    "severity",
+    "certainty",
+    "audience",
+    "effective",
+    "onset",
+    "expires",
+    "senderName",
+    "headline",
+    "description",
+    "instruction",
+    "web",
+    "contact",
+)
+_INFO_SCALAR_XPATH = etree.XPath(
+    "|".join(f"cap:{name}" for name in _INFO_SCALARS),
+    namespaces=NS_MAP,
+)
+
+
+def _info_scalars(elem: _Element) -> dict[str, str]:
+    """Collect the scalar cap:info fields in one compiled-XPath pass.
+
+    Args:
+        elem (_Element): cap:info element
+
+    Returns:
+        dict[str, str]: text of each present scalar, keyed by local name
+    """
+    scalars: dict[str, str] = {}
+    for node in _INFO_SCALAR_XPATH(elem):
+        key = node.tag.rsplit("}", 1)[1]
+        if key not in scalars:
+            scalars[key] = node.text or ""
+    return scalars
+
+
+def _required_scalar(scalars: dict[str, str], key: str) -> str:
+    """Fetch a required scalar field value.
+
+    Args:
+        scalars (dict[str, str]): collected scalar fields
+        key (str): local name of the field
+
+    Returns:
+        str: field text
+    """
+    try:
+        return scalars[key]
+    except KeyError:
+        raise RequiredElementNotFoundError(f"cap:{key}") from None
+
+
+def _scalar_date(scalars: dict[str, str], key: str) -> datetime | None:
+    """Parse an optional scalar field as a datetime.
+
+    Args:
+        scalars (dict[str, str]): collected scalar fields
+        key (str): local name of the field
+
+    Returns:
+        datetime | None: parsed datetime, if the field is present
+    """
+    if value := scalars.get(key):
+        return datetime.fromisoformat(value)
+    return None
+
+
 class Alert(Base):
     """An alert."""
 
@@ -157,36 +258,51 @@ class Alert(Base):
     )
 
     @classmethod
-    def from_element(cls, elem: _Element) -> Self:
+    def from_element(
+        cls,
+        elem: _Element,
+        _find_text=bucket_find_text,
+        _get_text=bucket_get_text,
+    ) -> Self:
         """Instantiate _cls_ from xml element.
 
+        The helper defaults are resolved once at function definition, so
+        each call loads them as locals instead of module globals.
+
         Args:
             elem (_Element): XML element representing _cls_.
 
         Returns:
             Self: Instantiated _cls_.
         """
+        buckets = bucket_children(elem)
+
         addresses = [
-            AlertAddress(address=x) for x in extract_quoted(elem, "cap:addresses")
+            AlertAddress(address=x)
+            for x in bucket_extract_quoted(buckets, "cap:addresses")
         ]
-        codes = [AlertCode(code=x) for x in findalltext(elem, "cap:code")]
+        codes = [AlertCode(code=x) for x in bucket_all_text(buckets, "cap:code")]
         references = [
-            AlertReference.from_text(x) for x in extract_quoted(elem, "cap:references")
+            AlertReference.from_text(x)
+            for x in bucket_extract_quoted(buckets, "cap:references")
         ]
         incidents = [
-            AlertIncident(incident=x) for x in extract_quoted(elem, "cap:incidents")
+            AlertIncident(incident=x)
+            for x in bucket_extract_quoted(buckets, "cap:incidents")
+        ]
+        alert_info = [
+            AlertInfo.from_element(x) for x in bucket_all(buckets, "cap:info")
         ]
-        alert_info = [AlertInfo.from_element(x) for x in findall(elem, "cap:info")]
         return cls(
-            identifier=find_text(elem, "cap:identifier"),
-            sender=find_text(elem, "cap:sender"),
-            sent=find_date(elem, "cap:sent"),
-            status=find_text(elem, "cap:status"),
-            msgtype=find_text(elem, "cap:msgType"),
-            source=find_text(elem, "cap:source"),
-            scope=find_text(elem, "cap:scope"),
-            restriction=get_text(elem, "cap:restriction"),
-            note=get_text(elem, "cap:note"),
+            identifier=_find_text(buckets, "cap:identifier"),
+            sender=_find_text(buckets, "cap:sender"),
+            sent=bucket_find_date(buckets, "cap:sent"),
+            status=_find_text(buckets, "cap:status"),
+            msgtype=_find_text(buckets, "cap:msgType"),
+            source=_find_text(buckets, "cap:source"),
+            scope=_find_text(buckets, "cap:scope"),
+            restriction=_get_text(buckets, "cap:restriction"),
+            note=_get_text(buckets, "cap:note"),
             addresses=addresses,
             codes=codes,
             references=references,
@@ -194,6 +310,174 @@ class Alert(Base):
             alert_info=alert_info,
         )
 
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> Self:
+        """Instantiate _cls_ from raw xml bytes.
+
+        Drives an XMLPullParser and converts on the cap:alert end event,
+        clearing the element afterwards so no tree outlives the call.
+
+        Args:
+            raw (bytes): utf-8 encoded CAP alert xml
+
+        Returns:
+            Self: Instantiated _cls_.
+        """
+        parser = etree.XMLPullParser(
+            events=("end",),
+            collect_ids=False,
+            resolve_entities=False,
+            remove_comments=True,
+            huge_tree=False,
+            no_network=True,
+        )
+        parser.feed(raw)
+
+        alert = None
+        for _, elem in parser.read_events():
+            if elem.tag == _ALERT_TAG:
+                alert = cls.from_element(elem)
+                elem.clear(keep_tail=True)
+        parser.close()
+
+        if alert is None:
+            raise RequiredElementNotFoundError("cap:alert")
+        return alert
+
+    @classmethod
+    def iter_from_stream(cls, source: IO[bytes] | str | Path) -> Iterator[Self]:
+        """Yield alerts from a multi-alert xml document, one at a time.
+
+        iterparse only materializes the subtree of each cap:alert, and
+        finished elements are cleared and detached from their parent, so
+        peak memory stays per-alert no matter how large the document is.
+
+        Args:
+            source (IO[bytes] | str | Path): xml file or file-like object
+
+        Yields:
+            Self: one instance per cap:alert element
+        """
+        for _, elem in etree.iterparse(
+            source,
+            events=("end",),
+            tag=_ALERT_TAG,
+            collect_ids=False,
+            resolve_entities=False,
+            remove_comments=True,
+            huge_tree=False,
+            no_network=True,
+        ):
+            yield cls.from_element(elem)
+            elem.clear(keep_tail=True)
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+    @classmethod
+    def bulk_insert(cls, session: Session, alerts: Sequence[Self]) -> None:
+        """Bulk insert parsed alerts with Core insert statements.
+
+        Flattens the object graphs into per-table row buffers and inserts
+        them parent-first, taking child foreign keys from RETURNING
+        (served by insertmanyvalues) instead of ORM cascade flushes.
+        The caller owns the transaction.
+
+        Args:
+            session (Session): database session
+            alerts (Sequence[Self]): parsed alerts to insert
+        """
+        buf = AlertBuffer()
+        for alert in alerts:
+            buf.add(alert)
+        buf.flush(session)
+
+    @classmethod
+    def parse_into(cls, elem: _Element, buf: AlertBuffer) -> None:
+        """Parse a cap:alert element straight into per-table row buffers.
+
+        Skips the ORM object graph that from_element builds; every field
+        lands directly in the dict that bulk insert will ship, so the
+        bulk path allocates no transient instrumented objects.
+
+        Args:
+            elem (_Element): cap:alert element
+            buf (AlertBuffer): destination row buffers
+        """
+        buckets = bucket_children(elem)
+
+        alert_idx = len(buf.alerts)
+        buf.alerts.append(
+            {
+                "identifier": bucket_find_text(buckets, "cap:identifier"),
+                "sender": bucket_find_text(buckets, "cap:sender"),
+                "sent": bucket_find_date(buckets, "cap:sent"),
+                "status": bucket_find_text(buckets, "cap:status"),
+                "msgtype": bucket_find_text(buckets, "cap:msgType"),
+                "source": bucket_find_text(buckets, "cap:source"),
+                "scope": bucket_find_text(buckets, "cap:scope"),
+                "restriction": bucket_get_text(buckets, "cap:restriction"),
+                "note": bucket_get_text(buckets, "cap:note"),
+            },
+        )
+        buf.addresses.extend(
+            {"alert_id": alert_idx, "address": x}
+            for x in bucket_extract_quoted(buckets, "cap:addresses")
+        )
+        buf.codes.extend(
+            {"alert_id": alert_idx, "code": x}
+            for x in bucket_all_text(buckets, "cap:code")
+        )
+        for text in bucket_extract_quoted(buckets, "cap:references"):
+            ref = AlertReference.from_text(text)
+            buf.references.append(
+                {
+                    "alert_id": alert_idx,
+                    "sender": ref.sender,
+                    "identifier": ref.identifier,
+                    "sent": ref.sent,
+                },
+            )
+        buf.incidents.extend(
+            {"alert_id": alert_idx, "incident": x}
+            for x in bucket_extract_quoted(buckets, "cap:incidents")
+        )
+        for info_elem in bucket_all(buckets, "cap:info"):
+            AlertInfo.parse_into(info_elem, buf, alert_idx)
+
+    @classmethod
+    def parse_bytes_into(cls, raw: bytes, buf: AlertBuffer) -> None:
+        """Parse raw xml bytes straight into per-table row buffers.
+
+        The dict-path counterpart of from_bytes: callers that only bulk
+        insert never build an instrumented Alert object graph at all.
+
+        Args:
+            raw (bytes): utf-8 encoded CAP alert xml
+            buf (AlertBuffer): destination row buffers
+        """
+        parser = etree.XMLPullParser(
+            events=("end",),
+            collect_ids=False,
+            resolve_entities=False,
+            remove_comments=True,
+            huge_tree=False,
+            no_network=True,
+        )
+        parser.feed(raw)
+
+        found = False
+        for _, elem in parser.read_events():
+            if elem.tag == _ALERT_TAG:
+                cls.parse_into(elem, buf)
+                found = True
+                elem.clear(keep_tail=True)
+        parser.close()
+
+        if not found:
+            raise RequiredElementNotFoundError("cap:alert")
+
 
 class AlertAddress(Base):
     """Address associated with an Alert."""
@@ -254,13 +538,18 @@ class AlertReference(Base):
         Returns:
             Self: Instantiated AlertReference.
         """
+        sender, sep, rest = text.partition(",")
+        if not sep:
+            return cls(sender=None, identifier=text, sent=None)
+
+        identifier, sep, sent_str = rest.partition(",")
+        if not sep or "," in sent_str:
+            return cls(sender=None, identifier=text, sent=None)
+
         try:
-            sender, identifier, sent_str = text.split(",")
             sent = datetime.fromisoformat(sent_str)
         except ValueError:
-            identifier = text
-            sender = None
-            sent = None
+            return cls(sender=None, identifier=text, sent=None)
 
         return cls(sender=sender, identifier=identifier, sent=sent)
 
@@ -277,19 +566,19 @@ class AlertInfo(Base):
     urgency: Mapped[AlertUrgency] = mapped_column(
         sqlalchemy.Enum(
             AlertUrgency,
-            values_callable=lambda t: [str(item.value) for item in t],
+            values_callable=lambda _t, values=_URGENCY_VALUES: values,
         ),
     )
     severity: Mapped[AlertSeverity] = mapped_column(
         sqlalchemy.Enum(
             AlertSeverity,
-            values_callable=lambda t: [str(item.value) for item in t],
+            values_callable=lambda _t, values=_SEVERITY_VALUES: values,
         ),
     )
     certainty: Mapped[AlertCertainty] = mapped_column(
         sqlalchemy.Enum(
             AlertCertainty,
-            values_callable=lambda t: [str(item.value) for item in t],
+            values_callable=lambda _t, values=_CERTAINTY_VALUES: values,
         ),
     )
     audience: Mapped[str | None]
@@ -331,50 +620,65 @@ class AlertInfo(Base):
     alert: Mapped[Alert] = relationship(back_populates="alert_info")
 
     @classmethod
-    def from_element(cls, elem: _Element) -> Self:
+    def from_element(
+        cls,
+        elem: _Element,
+        _scalars=_info_scalars,
+        _required=_required_scalar,
+    ) -> Self:
         """Instantiate AlertInfo from xml element.
 
+        The scalar fields come from one compiled XPath pass; the helper
+        defaults are resolved once at function definition, so each call
+        loads them as locals instead of module globals.
+
         Args:
             elem (_Element): XML element representing AlertInfo.
 
         Returns:
             Self: Instantiated AlertInfo.
         """
+        buckets = bucket_children(elem)
+        scalars = _scalars(elem)
+
         response_types = [
-            AlertInfoResponseType(responsetype=AlertResponseTypeCode(x))
-            for x in findalltext(elem, "cap:responseType")
+            AlertInfoResponseType(responsetype=_RESPONSE_TYPE_MAP[x])
+            for x in bucket_all_text(buckets, "cap:responseType")
         ]
         event_codes = [
-            AlertInfoEventCode.from_element(x) for x in findall(elem, "cap:eventCode")
+            AlertInfoEventCode.from_element(x)
+            for x in bucket_all(buckets, "cap:eventCode")
         ]
         categories = [
-            AlertInfoCategory(category=AlertCategoryCode(x))
-            for x in findalltext(elem, "cap:category")
+            AlertInfoCategory(category=_CATEGORY_MAP[x])
+            for x in bucket_all_text(buckets, "cap:category")
         ]
         parameters = [
-            AlertInfoParameter.from_element(x) for x in findall(elem, "cap:parameter")
+            AlertInfoParameter.from_element(x)
+            for x in bucket_all(buckets, "cap:parameter")
         ]
         resources = [
-            AlertInfoResource.from_element(x) for x in findall(elem, "cap:resource")
+            AlertInfoResource.from_element(x)
+            for x in bucket_all(buckets, "cap:resource")
         ]
-        areas = [Area.from_element(x) for x in findall(elem, "cap:area")]
+        areas = [Area.from_element(x) for x in bucket_all(buckets, "cap:area")]
 
         return cls(
-            language=find_text(elem, "cap:language"),
-            event=find_text(elem, "cap:event"),
-            urgency=AlertUrgency(find_text(elem, "cap:urgency")),
-            severity=AlertSeverity(find_text(elem, "cap:severity")),
-            certainty=AlertCertainty(find_text(elem, "cap:certainty")),
-            audience=get_text(elem, "cap:audience"),
-            effective=get_date(elem, "cap:effective"),
-            onset=get_date(elem, "cap:onset"),
-            expires=get_date(elem, "cap:expires"),
-            sender_name=get_text(elem, "cap:senderName"),
-            headline=get_text(elem, "cap:headline"),
-            description=get_text(elem, "cap:description"),
-            instruction=get_text(elem, "cap:instruction"),
-            web=get_text(elem, "cap:web"),
-            contact=get_text(elem, "cap:contact"),
+            language=_required(scalars, "language"),
+            event=_required(scalars, "event"),
+            urgency=_URGENCY_MAP[_required(scalars, "urgency")],
+            severity=_SEVERITY_MAP[_required(scalars, "severity")],
+            certainty=_CERTAINTY_MAP[_required(scalars, "certainty")],
+            audience=scalars.get("audience"),
+            effective=_scalar_date(scalars, "effective"),
+            onset=_scalar_date(scalars, "onset"),
+            expires=_scalar_date(scalars, "expires"),
+            sender_name=scalars.get("senderName"),
+            headline=scalars.get("headline"),
+            description=scalars.get("description"),
+            instruction=scalars.get("instruction"),
+            web=scalars.get("web"),
+            contact=scalars.get("contact"),
             response_types=response_types,
             categories=categories,
             event_codes=event_codes,
@@ -383,6 +687,78 @@ class AlertInfo(Base):
             areas=areas,
         )
 
+    @classmethod
+    def parse_into(cls, elem: _Element, buf: AlertBuffer, alert_idx: int) -> None:
+        """Parse a cap:info element straight into per-table row buffers.
+
+        Args:
+            elem (_Element): cap:info element
+            buf (AlertBuffer): destination row buffers
+            alert_idx (int): buffer index of the parent alert row
+        """
+        buckets = bucket_children(elem)
+        scalars = _info_scalars(elem)
+
+        info_idx = len(buf.infos)
+        buf.infos.append(
+            {
+                "alert_id": alert_idx,
+                "language": _required_scalar(scalars, "language"),
+                "event": _required_scalar(scalars, "event"),
+                "urgency": _URGENCY_MAP[_required_scalar(scalars, "urgency")],
+                "severity": _SEVERITY_MAP[_required_scalar(scalars, "severity")],
+                "certainty": _CERTAINTY_MAP[_required_scalar(scalars, "certainty")],
+                "audience": scalars.get("audience"),
+                "effective": _scalar_date(scalars, "effective"),
+                "onset": _scalar_date(scalars, "onset"),
+                "expires": _scalar_date(scalars, "expires"),
+                "sender_name": scalars.get("senderName"),
+                "headline": scalars.get("headline"),
+                "description": scalars.get("description"),
+                "instruction": scalars.get("instruction"),
+                "web": scalars.get("web"),
+                "contact": scalars.get("contact"),
+            },
+        )
+        buf.categories.extend(
+            {"alertinfo_id": info_idx, "category": _CATEGORY_MAP[x]}
+            for x in bucket_all_text(buckets, "cap:category")
+        )
+        buf.response_types.extend(
+            {"alertinfo_id": info_idx, "responsetype": _RESPONSE_TYPE_MAP[x]}
+            for x in bucket_all_text(buckets, "cap:responseType")
+        )
+        buf.event_codes.extend(
+            {
+                "alertinfo_id": info_idx,
+                "value_name": find_text(x, "cap:valueName"),
+                "value": find_text(x, "cap:value"),
+            }
+            for x in bucket_all(buckets, "cap:eventCode")
+        )
+        buf.parameters.extend(
+            {
+                "alertinfo_id": info_idx,
+                "value_name": find_text(x, "cap:valueName"),
+                "value": find_text(x, "cap:value"),
+            }
+            for x in bucket_all(buckets, "cap:parameter")
+        )
+        buf.resources.extend(
+            {
+                "alertinfo_id": info_idx,
+                "resource_description": find_text(x, "cap:resourceDesc"),
+                "mime_type": find_text(x, "cap:mimeType"),
+                "size": get_int(x, "cap:size"),
+                "uri": get_text(x, "cap:uri"),
+                "deref_uri": get_text(x, "cap:derefUri"),
+                "digest": get_text(x, "cap:digest"),
+            }
+            for x in bucket_all(buckets, "cap:resource")
+        )
+        for area_elem in bucket_all(buckets, "cap:area"):
+            Area.parse_into(area_elem, buf, info_idx)
+
 
 class AlertInfoCategory(Base):
     """A category associated with an AlertInfo."""
@@ -394,7 +770,7 @@ class AlertInfoCategory(Base):
     category: Mapped[AlertCategoryCode] = mapped_column(
         sqlalchemy.Enum(
             AlertCategoryCode,
-            values_callable=lambda t: [str(item.value) for item in t],
+            values_callable=lambda _t, values=_CATEGORY_VALUES: values,
         ),
     )
 
@@ -537,29 +913,70 @@ class Area(Base):
         Returns:
             Self: Instantiated Area.
         """
+        buckets = bucket_children(elem)
+
         polygons = list(
             chain(
                 [
                     AreaPolygon.from_polygon_text(x)
-                    for x in findalltext(elem, "cap:polygon")
+                    for x in bucket_all_text(buckets, "cap:polygon")
                 ],
                 [
                     AreaPolygon.from_circle_text(x)
-                    for x in findalltext(elem, "cap:circle")
+                    for x in bucket_all_text(buckets, "cap:circle")
                 ],
             ),
         )
 
-        geocodes = [AreaGeoCode.from_element(x) for x in findall(elem, "cap:geocode")]
+        geocodes = [
+            AreaGeoCode.from_element(x) for x in bucket_all(buckets, "cap:geocode")
+        ]
 
         return cls(
-            area_description=find_text(elem, "cap:areaDesc"),
-            altitude=get_int(elem, "cap:altitude"),
-            ceiling=get_int(elem, "cap:ceiling"),
+            area_description=bucket_find_text(buckets, "cap:areaDesc"),
+            altitude=bucket_get_int(buckets, "cap:altitude"),
+            ceiling=bucket_get_int(buckets, "cap:ceiling"),
             polygons=polygons,
             geocodes=geocodes,
         )
 
+    @classmethod
+    def parse_into(cls, elem: _Element, buf: AlertBuffer, info_idx: int) -> None:
+        """Parse a cap:area element straight into per-table row buffers.
+
+        Args:
+            elem (_Element): cap:area element
+            buf (AlertBuffer): destination row buffers
+            info_idx (int): buffer index of the parent info row
+        """
+        buckets = bucket_children(elem)
+
+        area_idx = len(buf.areas)
+        buf.areas.append(
+            {
+                "alertinfo_id": info_idx,
+                "area_description": bucket_find_text(buckets, "cap:areaDesc"),
+                "altitude": bucket_get_int(buckets, "cap:altitude"),
+                "ceiling": bucket_get_int(buckets, "cap:ceiling"),
+            },
+        )
+        buf.polygons.extend(
+            {"area_id": area_idx, "geom": AreaPolygon.polygon_geom(x)}
+            for x in bucket_all_text(buckets, "cap:polygon")
+        )
+        buf.polygons.extend(
+            {"area_id": area_idx, "geom": AreaPolygon.circle_geom(x)}
+            for x in bucket_all_text(buckets, "cap:circle")
+        )
+        buf.geocodes.extend(
+            {
+                "area_id": area_idx,
+                "value_name": find_text(x, "cap:valueName"),
+                "value": find_text(x, "cap:value"),
+            }
+            for x in bucket_all(buckets, "cap:geocode")
+        )
+
 
 class AreaGeoCode(Base):
     """Geocode-based description for an area."""
@@ -589,6 +1006,14 @@ class AreaGeoCode(Base):
         )
 
 
+# little-endian EWKB prefix for an SRID 4326 polygon: byte order marker,
+# polygon type with the SRID flag set, then the SRID itself
+_EWKB_POLYGON_HEADER = struct.pack("<BII", 1, 0x20000003, 4326)
+
+_EARTH_RADIUS_KM = 6371.0088
+_CIRCLE_VERTICES = 64
+
+
 class AreaPolygon(Base):
     """Polygon-based description for an area."""
 
@@ -602,25 +1027,103 @@ class AreaPolygon(Base):
 
     area: Mapped[Area] = relationship(back_populates="polygons")
 
-    @classmethod
-    def from_circle_text(cls, text: str) -> Self:
-        """Instantiate Polygon from text description of circle.
+    @staticmethod
+    def circle_geom(text: str) -> WKBElement:
+        """Build the geometry value for a text description of a circle.
+
+        The CAP radius is kilometers on WGS84, so the vertices are laid
+        out as a small circle on the sphere rather than buffering a
+        point in degree space through GEOS.
 
         Args:
             text (str): text description of circle.
 
         Returns:
-            Self: Polygon representing the circle.
+            WKBElement: polygon approximating the circle.
         """
         try:
-            coords, radius = text.split()
-            latitude, longitude = coords.split(",")
+            center, radius = text.split()
+            latitude, longitude = center.split(",")
+            lat = float(latitude)
+            lon = float(longitude)
+            radius_km = float(radius)
         except ValueError as e:
             msg = "Malformed AreaPolygon[circle]"
             raise MalformedPolygonError(msg, text) from e
 
-        circle = Point(float(latitude), float(longitude)).buffer(float(radius) * 1000)
-        return cls(geom=from_shape(circle, srid=4326))
+        dlat = math.degrees(radius_km / _EARTH_RADIUS_KM)
+        dlon = dlat / math.cos(math.radians(lat))
+
+        coords = []
+        step = math.tau / _CIRCLE_VERTICES
+        for i in range(_CIRCLE_VERTICES):
+            coords.append(lon + dlon * math.sin(i * step))
+            coords.append(lat + dlat * math.cos(i * step))
+        coords.extend(coords[:2])
+
+        wkb = _EWKB_POLYGON_HEADER + struct.pack(
+            f"<II{len(coords)}d",
+            1,  # one ring
+            _CIRCLE_VERTICES + 1,
+            *coords,
+        )
+        return WKBElement(wkb, extended=True)
+
+    @staticmethod
+    def polygon_geom(text: str) -> WKBElement:
+        """Build the geometry value for a text description of a polygon.
+
+        The CAP text is already a coordinate list, so the EWKB is packed
+        directly from the parsed floats instead of round-tripping every
+        vertex through shapely/GEOS objects, and the binary form saves
+        PostGIS the server-side WKT parse.
+
+        Args:
+            text (str): text description of polygon.
+
+        Returns:
+            WKBElement: EWKB polygon.
+        """
+        try:
+            values = [float(x) for x in text.replace(",", " ").split()]
+        except ValueError as e:
+            msg = "Malformed AreaPolygon[polygon]"
+            raise MalformedPolygonError(msg, text) from e
+
+        # a well-formed list has one comma per lat,lon pair and at least
+        # three vertices to make a ring
+        if len(values) % 2 or text.count(",") * 2 != len(values) or len(values) < 6:
+            msg = "Malformed AreaPolygon[polygon]"
+            raise MalformedPolygonError(msg, text)
+
+        # swap the lat,lon pairs to lon,lat with two slice assignments
+        coords = [0.0] * len(values)
+        coords[0::2] = values[1::2]
+        coords[1::2] = values[0::2]
+
+        if coords[:2] != coords[-2:]:
+            coords.extend(coords[:2])
+
+        n_points = len(coords) // 2
+        wkb = _EWKB_POLYGON_HEADER + struct.pack(
+            f"<II{len(coords)}d",
+            1,  # one ring
+            n_points,
+            *coords,
+        )
+        return WKBElement(wkb, extended=True)
+
+    @classmethod
+    def from_circle_text(cls, text: str) -> Self:
+        """Instantiate Polygon from text description of circle.
+
+        Args:
+            text (str): text description of circle.
+
+        Returns:
+            Self: Polygon representing the circle.
+        """
+        return cls(geom=cls.circle_geom(text))
 
     @classmethod
     def from_polygon_text(cls, text: str) -> Self:
@@ -632,16 +1135,222 @@ class AreaPolygon(Base):
         Returns:
             Self: Instantiated Polygon.
         """
-        points = []
+        return cls(geom=cls.polygon_geom(text))
+
+
+class AlertBuffer:
+    """Per-table row buffers for bulk loading alerts.
+
+    Rows are plain dicts keyed by destination table, so the bulk path
+    allocates no instrumented ORM objects between parse and insert.
+    Child rows carry the positional index of their parent row under the
+    foreign key column; flush() inserts parent-first and rewrites those
+    indexes into the ids handed back by RETURNING, which
+    sort_by_parameter_order keeps aligned with input order.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty per-table buffers."""
+        self.alerts: list[dict] = []
+        self.addresses: list[dict] = []
+        self.codes: list[dict] = []
+        self.references: list[dict] = []
+        self.incidents: list[dict] = []
+        self.infos: list[dict] = []
+        self.categories: list[dict] = []
+        self.response_types: list[dict] = []
+        self.event_codes: list[dict] = []
+        self.parameters: list[dict] = []
+        self.resources: list[dict] = []
+        self.areas: list[dict] = []
+        self.polygons: list[dict] = []
+        self.geocodes: list[dict] = []
+
+    def add(self, alert: Alert) -> None:
+        """Buffer an already-built ORM alert graph as row dicts.
 
-        try:
-            for point in text.split():
-                latitude, longitude = point.split(",")
-                points.append(Point(float(longitude), float(latitude)))
-        except ValueError as e:
-            msg = "Malformed AreaPolygon[polygon]"
-            raise MalformedPolygonError(msg, text) from e
+        Args:
+            alert (Alert): parsed alert object graph
+        """
+        alert_idx = len(self.alerts)
+        self.alerts.append(
+            {
+                "identifier": alert.identifier,
+                "sender": alert.sender,
+                "sent": alert.sent,
+                "status": alert.status,
+                "msgtype": alert.msgtype,
+                "source": alert.source,
+                "scope": alert.scope,
+                "restriction": alert.restriction,
+                "note": alert.note,
+            },
+        )
+        self.addresses.extend(
+            {"alert_id": alert_idx, "address": x.address} for x in alert.addresses
+        )
+        self.codes.extend({"alert_id": alert_idx, "code": x.code} for x in alert.codes)
+        self.references.extend(
+            {
+                "alert_id": alert_idx,
+                "sender": x.sender,
+                "identifier": x.identifier,
+                "sent": x.sent,
+            }
+            for x in alert.references
+        )
+        self.incidents.extend(
+            {"alert_id": alert_idx, "incident": x.incident} for x in alert.incidents
+        )
 
-        polygon = Polygon(points)
+        for info in alert.alert_info:
+            info_idx = len(self.infos)
+            self.infos.append(
+                {
+                    "alert_id": alert_idx,
+                    "language": info.language,
+                    "event": info.event,
+                    "urgency": info.urgency,
+                    "severity": info.severity,
+                    "certainty": info.certainty,
+                    "audience": info.audience,
+                    "effective": info.effective,
+                    "onset": info.onset,
+                    "expires": info.expires,
+                    "sender_name": info.sender_name,
+                    "headline": info.headline,
+                    "description": info.description,
+                    "instruction": info.instruction,
+                    "web": info.web,
+                    "contact": info.contact,
+                },
+            )
+            self.categories.extend(
+                {"alertinfo_id": info_idx, "category": x.category}
+                for x in info.categories
+            )
+            self.response_types.extend(
+                {"alertinfo_id": info_idx, "responsetype": x.responsetype}
+                for x in info.response_types
+            )
+            self.event_codes.extend(
+                {
+                    "alertinfo_id": info_idx,
+                    "value_name": x.value_name,
+                    "value": x.value,
+                }
+                for x in info.event_codes
+            )
+            self.parameters.extend(
+                {
+                    "alertinfo_id": info_idx,
+                    "value_name": x.value_name,
+                    "value": x.value,
+                }
+                for x in info.parameters
+            )
+            self.resources.extend(
+                {
+                    "alertinfo_id": info_idx,
+                    "resource_description": x.resource_description,
+                    "mime_type": x.mime_type,
+                    "size": x.size,
+                    "uri": x.uri,
+                    "deref_uri": x.deref_uri,
+                    "digest": x.digest,
+                }
+                for x in info.resources
+            )
+
+            for area in info.areas:
+                area_idx = len(self.areas)
+                self.areas.append(
+                    {
+                        "alertinfo_id": info_idx,
+                        "area_description": area.area_description,
+                        "altitude": area.altitude,
+                        "ceiling": area.ceiling,
+                    },
+                )
+                self.polygons.extend(
+                    {"area_id": area_idx, "geom": x.geom} for x in area.polygons
+                )
+                self.geocodes.extend(
+                    {
+                        "area_id": area_idx,
+                        "value_name": x.value_name,
+                        "value": x.value,
+                    }
+                    for x in area.geocodes
+                )
+
+    def flush(self, session: Session) -> None:
+        """Insert the buffered rows parent-first and clear the buffers.
+
+        The caller owns the transaction.
 
-        return cls(geom=from_shape(polygon, srid=4326))
+        Args:
+            session (Session): database session
+        """
+        # an empty parameter list would fall back to a single-row
+        # INSERT ... DEFAULT VALUES rather than inserting nothing
+        if not self.alerts:
+            return
+
+        alert_ids = session.scalars(
+            insert(Alert).returning(Alert.id, sort_by_parameter_order=True),
+            self.alerts,
+        ).all()
+        for model, rows in (
+            (AlertAddress, self.addresses),
+            (AlertCode, self.codes),
+            (AlertReference, self.references),
+            (AlertIncident, self.incidents),
+        ):
+            for row in rows:
+                row["alert_id"] = alert_ids[row["alert_id"]]
+            if rows:
+                session.execute(insert(model), rows)
+
+        info_ids = []
+        if self.infos:
+            for row in self.infos:
+                row["alert_id"] = alert_ids[row["alert_id"]]
+            info_ids = session.scalars(
+                insert(AlertInfo).returning(
+                    AlertInfo.id,
+                    sort_by_parameter_order=True,
+                ),
+                self.infos,
+            ).all()
+        for model, rows in (
+            (AlertInfoCategory, self.categories),
+            (AlertInfoResponseType, self.response_types),
+            (AlertInfoEventCode, self.event_codes),
+            (AlertInfoParameter, self.parameters),
+            (AlertInfoResource, self.resources),
+        ):
+            for row in rows:
+                row["alertinfo_id"] = info_ids[row["alertinfo_id"]]
+            if rows:
+                session.execute(insert(model), rows)
+
+        area_ids = []
+        if self.areas:
+            for row in self.areas:
+                row["alertinfo_id"] = info_ids[row["alertinfo_id"]]
+            area_ids = session.scalars(
+                insert(Area).returning(Area.id, sort_by_parameter_order=True),
+                self.areas,
+            ).all()
+        for model, rows in (
+            (AreaPolygon, self.polygons),
+            (AreaGeoCode, self.geocodes),
+        ):
+            for row in rows:
+                row["area_id"] = area_ids[row["area_id"]]
+            if rows:
+                session.execute(insert(model), rows)
+
+        for buffered in vars(self).values():
+            buffered.clear()
@@ -0,0 +1,45 @@
+"""openfema.py -- shared decoding of OpenFEMA IpawsArchivedAlerts archives."""
+
+from typing import TYPE_CHECKING
+
+import msgspec.json
+import zstandard
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class AlertLine(msgspec.Struct, frozen=True):
+    """One IpawsArchivedAlerts jsonl record; only the raw CAP xml is kept."""
+
+    # wire name set by the OpenFEMA api
+    original_message: str = msgspec.field(name="originalMessage")
+
+
+_DECODER = msgspec.json.Decoder(AlertLine)
+
+
+def iter_records(file_path: Path) -> Iterator[AlertLine]:
+    """Stream decoded records, amortizing decode calls over 8 MiB chunks.
+
+    Each chunk is cut at the last newline and handed to decode_lines in
+    one call, so the per-record Python dispatch of a line loop is gone.
+
+    Args:
+        file_path (Path): zstd compressed jsonl file
+
+    Yields:
+        AlertLine: decoded records
+    """
+    decompressor = zstandard.ZstdDecompressor()
+    with file_path.open("rb") as raw_file:
+        reader = decompressor.stream_reader(raw_file)
+        remainder = b""
+        while chunk := reader.read(8 << 20):
+            buffer = remainder + chunk
+            cut = buffer.rfind(b"\n") + 1
+            remainder = buffer[cut:]
+            yield from _DECODER.decode_lines(buffer[:cut])
+        if remainder:
+            yield from _DECODER.decode_lines(remainder)
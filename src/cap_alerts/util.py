@@ -1,15 +1,42 @@
 """Utility functions for cap_alerts."""
 
+import csv
+import io
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-import pyparsing as pp
+from lxml import etree
 
 from cap_alerts import NS_MAP
 
 if TYPE_CHECKING:
     from lxml.etree import _Element
 
+# bound once so the date helpers skip the attribute lookup per call
+_fromiso = datetime.fromisoformat
+
+
+def _split_quoted(text: str) -> list[str]:
+    """Split a space-delimited token list, honoring double quotes.
+
+    Only double quotes are special: free text with apostrophes or
+    backslashes passes through unchanged instead of raising, which
+    matters for fields like cap:addresses that carry arbitrary prose.
+
+    Args:
+        text (str): raw element text
+
+    Returns:
+        list[str]: list of tokens
+    """
+    reader = csv.reader(
+        io.StringIO(text),
+        delimiter=" ",
+        quotechar='"',
+        skipinitialspace=True,
+    )
+    return [token for row in reader for token in row if token]
+
 
 class IPAWSAlertsError(Exception):
     """Base class for custom exceptions in this module."""
@@ -43,6 +70,28 @@ class MalformedPolygonError(IPAWSAlertsError):
         self.detail = detail
 
 
+# Clark-notation ("{uri}name") tags resolved once per prefixed name;
+# passing these to lxml avoids re-binding the namespace map on every call
+_TAGS: dict[str, str] = {}
+
+
+def _tag(xpath: str) -> str:
+    """Expand a prefixed name like cap:sent to its Clark-notation tag.
+
+    Args:
+        xpath (str): prefixed element name
+
+    Returns:
+        str: Clark-notation tag
+    """
+    try:
+        return _TAGS[xpath]
+    except KeyError:
+        prefix, _, name = xpath.partition(":")
+        tag = _TAGS[xpath] = f"{{{NS_MAP[prefix]}}}{name}"
+        return tag
+
+
 def convint(st: str) -> int:
     """Forcefuly convert a number like string to integer.
 
@@ -54,9 +103,13 @@ def convint(st: str) -> int:
     Returns:
         int: integer found
     """
+    # branching on the float markers up front keeps the common paths off
+    # the exception machinery; the fallback still catches odd inputs
+    if "." in st or "e" in st or "E" in st:
+        return int(float(st))
     try:
         return int(st)
-    except ValueError:  # If you get a ValueError
+    except ValueError:
         return int(float(st))
 
 
@@ -72,7 +125,7 @@ def find(elem: _Element, xpath: str) -> _Element | None:
     Returns:
         _Element | None: found element, if any.
     """
-    return elem.find(xpath, namespaces=NS_MAP)
+    return elem.find(_tag(xpath))
 
 
 def get_text(elem: _Element, xpath: str) -> str | None:
@@ -87,7 +140,7 @@ def get_text(elem: _Element, xpath: str) -> str | None:
     Returns:
         str | None: found text
     """
-    return elem.findtext(xpath, namespaces=NS_MAP)
+    return elem.findtext(_tag(xpath))
 
 
 def find_text(elem: _Element, xpath: str) -> str:
@@ -102,7 +155,7 @@ def find_text(elem: _Element, xpath: str) -> str:
     Returns:
         str | None: found text
     """
-    result = elem.findtext(xpath, namespaces=NS_MAP)
+    result = elem.findtext(_tag(xpath))
     if result is None:
         raise RequiredElementNotFoundError(xpath)
     return result
@@ -120,7 +173,7 @@ def findall(elem: _Element, xpath: str) -> list[_Element]:
     Returns:
         list[_Element]: list of found subelements
     """
-    return elem.findall(xpath, namespaces=NS_MAP)
+    return elem.findall(_tag(xpath))
 
 
 def find_int(elem: _Element, xpath: str) -> int | None:
@@ -149,6 +202,12 @@ def get_int(elem: _Element, xpath: str) -> int | None:
     return convint(x) if (x := get_text(elem, xpath)) is not None else None
 
 
+# compiled text() XPath per prefixed name; returning strings straight
+# from C skips the per-element proxies findall would allocate, and
+# smart_strings=False yields plain str instead of wrapper objects
+_TEXT_XPATHS: dict[str, etree.XPath] = {}
+
+
 def findalltext(elem: _Element, xpath: str) -> list[str]:
     """A convenience hybrid of findall and findtext.
 
@@ -159,12 +218,152 @@ def findalltext(elem: _Element, xpath: str) -> list[str]:
     Returns:
         list[str]: list of strings found
     """
-    return [x.text for x in findall(elem, xpath) if x.text is not None]
+    try:
+        text_xpath = _TEXT_XPATHS[xpath]
+    except KeyError:
+        text_xpath = _TEXT_XPATHS[xpath] = etree.XPath(
+            xpath + "/text()",
+            namespaces=NS_MAP,
+            smart_strings=False,
+        )
+    return text_xpath(elem)
+
 
+def bucket_children(elem: _Element) -> dict[str, list[_Element]]:
+    """Group an element's children by tag in a single pass.
 
-quoted_str_parser = pp.OneOrMore(
-    pp.QuotedString(quote_char='"') | pp.Word(pp.printables, exclude_chars='"'),
-)
+    One iteration over the children replaces the repeated subtree walks
+    that separate find/findall calls each perform.
+
+    Args:
+        elem (_Element): parent element
+
+    Returns:
+        dict[str, list[_Element]]: children keyed by Clark-notation tag
+    """
+    buckets: dict[str, list[_Element]] = {}
+    for child in elem:
+        # comments and processing instructions carry non-str tags
+        if isinstance(tag := child.tag, str):
+            buckets.setdefault(tag, []).append(child)
+    return buckets
+
+
+def bucket_all(buckets: dict[str, list[_Element]], xpath: str) -> list[_Element]:
+    """All bucketed children with the given prefixed name.
+
+    Args:
+        buckets (dict): children grouped by bucket_children
+        xpath (str): prefixed element name
+
+    Returns:
+        list[_Element]: matching children
+    """
+    return buckets.get(_tag(xpath), [])
+
+
+def bucket_all_text(buckets: dict[str, list[_Element]], xpath: str) -> list[str]:
+    """Text of all bucketed children with the given prefixed name.
+
+    Args:
+        buckets (dict): children grouped by bucket_children
+        xpath (str): prefixed element name
+
+    Returns:
+        list[str]: text of matching children
+    """
+    return [x.text for x in buckets.get(_tag(xpath), []) if x.text is not None]
+
+
+def bucket_get_text(buckets: dict[str, list[_Element]], xpath: str) -> str | None:
+    """Text of the first bucketed child with the given prefixed name, if any.
+
+    Args:
+        buckets (dict): children grouped by bucket_children
+        xpath (str): prefixed element name
+
+    Returns:
+        str | None: found text
+    """
+    if children := buckets.get(_tag(xpath)):
+        return children[0].text or ""
+    return None
+
+
+def bucket_find_text(buckets: dict[str, list[_Element]], xpath: str) -> str:
+    """Text of the first bucketed child with the given prefixed name.
+
+    Args:
+        buckets (dict): children grouped by bucket_children
+        xpath (str): prefixed element name
+
+    Returns:
+        str: found text
+    """
+    text = bucket_get_text(buckets, xpath)
+    if text is None:
+        raise RequiredElementNotFoundError(xpath)
+    return text
+
+
+def bucket_get_int(buckets: dict[str, list[_Element]], xpath: str) -> int | None:
+    """Integer value of the first bucketed child, if any.
+
+    Args:
+        buckets (dict): children grouped by bucket_children
+        xpath (str): prefixed element name
+
+    Returns:
+        int | None: found integer
+    """
+    return convint(x) if (x := bucket_get_text(buckets, xpath)) is not None else None
+
+
+def bucket_get_date(
+    buckets: dict[str, list[_Element]],
+    xpath: str,
+) -> datetime | None:
+    """Datetime value of the first bucketed child, if any.
+
+    Args:
+        buckets (dict): children grouped by bucket_children
+        xpath (str): prefixed element name
+
+    Returns:
+        datetime | None: parsed datetime
+    """
+    if got_string := bucket_get_text(buckets, xpath):
+        return _fromiso(got_string)
+    return None
+
+
+def bucket_find_date(buckets: dict[str, list[_Element]], xpath: str) -> datetime:
+    """Datetime value of the first bucketed child.
+
+    Args:
+        buckets (dict): children grouped by bucket_children
+        xpath (str): prefixed element name
+
+    Returns:
+        datetime: parsed datetime
+    """
+    return _fromiso(bucket_find_text(buckets, xpath))
+
+
+def bucket_extract_quoted(buckets: dict[str, list[_Element]], xpath: str) -> list[str]:
+    """Extract quoted tokens from the first bucketed child's text.
+
+    Args:
+        buckets (dict): children grouped by bucket_children
+        xpath (str): prefixed element name
+
+    Returns:
+        list[str]: list of strings
+    """
+    text = bucket_get_text(buckets, xpath)
+    if text:
+        return _split_quoted(text)
+    return []
 
 
 def extract_quoted(elem: _Element, xpath: str) -> list[str]:
@@ -179,8 +378,7 @@ def extract_quoted(elem: _Element, xpath: str) -> list[str]:
     """
     text = get_text(elem, xpath)
     if text:
-        results = quoted_str_parser.parse_string(text)
-        return results.as_list()
+        return _split_quoted(text)
     return []
 
 
@@ -210,7 +408,7 @@ def find_date(elem: _Element, xpath: str) -> datetime:
     Returns:
         datetime: parsed datetime
     """
-    return datetime.fromisoformat(find_text(elem, xpath))
+    return _fromiso(find_text(elem, xpath))
 
 
 def get_date(elem: _Element, xpath: str) -> datetime | None:
@@ -224,6 +422,6 @@ def get_date(elem: _Element, xpath: str) -> datetime | None:
         datetime | None: parsed datetime
     """
     if got_string := get_text(elem, xpath):
-        return datetime.fromisoformat(got_string)
+        return _fromiso(got_string)
 
     return None